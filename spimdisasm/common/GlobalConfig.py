@@ -5,52 +5,74 @@
 
 from __future__ import annotations
 
-import argparse
 import dataclasses
 import enum
 import os
+import sys
+from typing import TYPE_CHECKING
 
 from . import Utils
 from .OrderedEnum import OrderedEnum
 
+if TYPE_CHECKING:
+    import argparse
 
-class InputEndian(enum.Enum):
-    BIG = "big"
-    LITTLE = "little"
-    MIDDLE = "middle"
+
+class InputEndian(enum.IntEnum):
+    BIG = 0
+    LITTLE = 1
+    MIDDLE = 2
+
+    @classmethod
+    def _missing_(cls, value: object) -> InputEndian|None:
+        # Allows the old string values to still be used, like `InputEndian("big")`
+        if isinstance(value, str):
+            return _inputEndianByName.get(value)
+        return None
 
     @staticmethod
     def fromStr(value: str) -> InputEndian:
-        if value == "little":
-            return InputEndian.LITTLE
-        if value == "middle":
-            return InputEndian.MIDDLE
-        return InputEndian.BIG
+        return _inputEndianByName.get(value, InputEndian.BIG)
 
     def toFormatString(self) -> str:
         if self == InputEndian.BIG:
             return ">"
         if self == InputEndian.LITTLE:
             return "<"
-        raise ValueError(f"No struct format string available for : {self}")
+        raise ValueError(f"No struct format string available for : {self.name}")
+
+_inputEndianByName: dict[str, InputEndian] = {
+    "big": InputEndian.BIG,
+    "little": InputEndian.LITTLE,
+    "middle": InputEndian.MIDDLE,
+}
 
 
 compilerOptions = {"IDO", "GCC", "SN64", "PSYQ", "EGCS"}
 
 @enum.unique
-class Compiler(enum.Enum):
-    UNKNOWN = None
-    IDO = "IDO"
-    GCC = "GCC"
-    SN64 = "SN64"
-    PSYQ = "PSYQ"
-    EGCS = "EGCS"
+class Compiler(enum.IntEnum):
+    UNKNOWN = 0
+    IDO = 1
+    GCC = 2
+    SN64 = 3
+    PSYQ = 4
+    EGCS = 5
+
+    @classmethod
+    def _missing_(cls, value: object) -> Compiler|None:
+        # Allows the old string values to still be used, like `Compiler("IDO")`
+        if value is None:
+            return Compiler.UNKNOWN
+        if isinstance(value, str):
+            return _compilerByName.get(value)
+        return None
 
     @staticmethod
     def fromStr(value: str) -> Compiler:
-        if value not in compilerOptions:
-            return Compiler.UNKNOWN
-        return Compiler(value)
+        return _compilerByName.get(value, Compiler.UNKNOWN)
+
+_compilerByName: dict[str, Compiler] = {compiler.name: compiler for compiler in Compiler if compiler.name in compilerOptions}
 
 
 class Abi(enum.Enum):
@@ -105,7 +127,100 @@ class InputFileType(enum.Enum):
     ELF = "elf"
 
 
-@dataclasses.dataclass
+# Pairs of (argparse dest, GlobalConfig attribute) which are copied as-is by `parseArgs` if the argument was passed
+_argsToAttrs: tuple[tuple[str, str], ...] = (
+    ("disasm_unknown", "DISASSEMBLE_UNKNOWN_INSTRUCTIONS"),
+
+    ("rodata_string_guesser", "RODATA_STRING_GUESSER_LEVEL"),
+    ("data_string_guesser", "DATA_STRING_GUESSER_LEVEL"),
+    ("pascal_rodata_string_guesser", "PASCAL_RODATA_STRING_GUESSER_LEVEL"),
+    ("pascal_data_string_guesser", "PASCAL_DATA_STRING_GUESSER_LEVEL"),
+    # Deprecated ones must be processed after the string guesser levels
+    ("string_guesser", "STRING_GUESSER"),
+    ("aggressive_string_guesser", "AGGRESSIVE_STRING_GUESSER"),
+
+    ("name_vars_by_section", "AUTOGENERATED_NAMES_BASED_ON_SECTION_TYPE"),
+    ("name_vars_by_type", "AUTOGENERATED_NAMES_BASED_ON_DATA_TYPE"),
+
+    ("detect_redundant_function_end", "DETECT_REDUNDANT_FUNCTION_END"),
+
+    ("pic", "PIC"),
+    ("emit_cpload", "EMIT_CPLOAD"),
+    ("emit_inline_reloc", "EMIT_INLINE_RELOC"),
+
+    ("filter_low_addresses", "SYMBOL_FINDER_FILTER_LOW_ADDRESSES"),
+    ("filter_high_addresses", "SYMBOL_FINDER_FILTER_HIGH_ADDRESSES"),
+    ("filtered_addresses_as_constants", "SYMBOL_FINDER_FILTERED_ADDRESSES_AS_CONSTANTS"),
+    ("filtered_addresses_as_hilo", "SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO"),
+
+    ("allow_unksegment", "ALLOW_UNKSEGMENT"),
+    ("allow_all_addends_on_data", "ALLOW_ALL_ADDENDS_ON_DATA"),
+    ("allow_all_constants_on_data", "ALLOW_ALL_CONSTANTS_ON_DATA"),
+
+    ("asm_comments", "ASM_COMMENT"),
+    ("comment_offset_width", "ASM_COMMENT_OFFSET_WIDTH"),
+    ("glabel_count", "GLABEL_ASM_COUNT"),
+    ("asm_referencee_symbols", "ASM_REFERENCEE_SYMBOLS"),
+
+    ("asm_use_symbol_label", "ASM_USE_SYMBOL_LABEL"),
+    ("asm_func_as_label", "ASM_TEXT_FUNC_AS_LABEL"),
+    ("asm_data_as_label", "ASM_DATA_SYM_AS_LABEL"),
+    ("asm_emit_size_directive", "ASM_EMIT_SIZE_DIRECTIVE"),
+    ("asm_use_prelude", "ASM_USE_PRELUDE"),
+    ("asm_generated_by", "ASM_GENERATED_BY"),
+
+    ("print_new_file_boundaries", "PRINT_NEW_FILE_BOUNDARIES"),
+
+    ("use_dot_byte", "USE_DOT_BYTE"),
+    ("use_dot_short", "USE_DOT_SHORT"),
+
+    ("panic_range_check", "PANIC_RANGE_CHECK"),
+
+    ("create_data_pads", "CREATE_DATA_PADS"),
+    ("create_rodata_pads", "CREATE_RODATA_PADS"),
+
+    ("verbose", "VERBOSE"),
+    ("quiet", "QUIET"),
+
+    ("debug_func_analysis", "PRINT_FUNCTION_ANALYSIS_DEBUG_INFO"),
+    ("debug_symbol_finder", "PRINT_SYMBOL_FINDER_DEBUG_INFO"),
+    ("debug_unpaired_luis", "PRINT_UNPAIRED_LUIS_DEBUG_INFO"),
+)
+
+# Same as `_argsToAttrs`, but for string arguments. Empty strings are ignored too
+_nonEmptyArgsToAttrs: tuple[tuple[str, str], ...] = (
+    ("custom_suffix", "CUSTOM_SUFFIX"),
+
+    ("asm_text_label", "ASM_TEXT_LABEL"),
+    ("asm_text_alt_label", "ASM_TEXT_ALT_LABEL"),
+    ("asm_jtbl_label", "ASM_JTBL_LABEL"),
+    ("asm_data_label", "ASM_DATA_LABEL"),
+    ("asm_ent_label", "ASM_TEXT_ENT_LABEL"),
+    ("asm_end_label", "ASM_TEXT_END_LABEL"),
+)
+
+
+# The per-level explanation is the bulk of the `--rodata-string-guesser` help and does not depend on the current config,
+# so it is built only once instead of each time the arguments are added to a parser
+_stringGuesserLevelsHelp = """\
+A C string must start at a 0x4-aligned region, which is '\\0' terminated and padded with '\\0's until a 0x4 boundary.
+
+- level 0: Completely disable the guessing feature.
+- level 1: The most conservative guessing level. Imposes the following restrictions:
+    - Do not try to guess if the user provided a type for the symbol.
+    - Do no try to guess if type information for the symbol can be inferred by other means.
+    - A string symbol must be referenced only once.
+    - Strings must not be empty.
+- level 2: A string no longer needs to be referenced only once to be considered a possible string. This can happen because of a deduplication optimization.
+- level 3: Empty strings are allowed.
+- level 4: Symbols with autodetected type information but no user type information can still be guessed as strings.
+"""
+
+
+# `slots` makes every `GlobalConfig.X` read a slot load instead of an instance dict lookup. It was added in Python 3.10
+_globalConfigDataclassKwargs: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclasses.dataclass(**_globalConfigDataclassKwargs)
 class GlobalConfigType:
     DISASSEMBLE_UNKNOWN_INSTRUCTIONS: bool = False
     """Try to disassemble non implemented instructions and functions"""
@@ -277,43 +392,38 @@ class GlobalConfigType:
     """write to files splitted binaries"""
 
 
-    def addParametersToArgParse(self, parser: argparse.ArgumentParser):
-        backendConfig = parser.add_argument_group("Disassembler backend configuration")
+    def _addBooleanArgument(self, group: argparse._ArgumentGroup, optionName: str, attrName: str, helpText: str):
+        group.add_argument(optionName, help=f"{helpText} Defaults to {getattr(self, attrName)}", action=Utils.BooleanOptionalAction)
 
-        backendConfig.add_argument("--disasm-unknown", help=f"Force disassembling functions with unknown instructions. Defaults to {self.DISASSEMBLE_UNKNOWN_INSTRUCTIONS}", action=Utils.BooleanOptionalAction)
+    def addParametersToArgParse(self, parser: argparse.ArgumentParser):
+        self._addBackendParametersToArgParse(parser)
+        self._addMiscParametersToArgParse(parser)
+        self._addVerbosityParametersToArgParse(parser)
+        self._addDebuggingParametersToArgParse(parser)
 
-        rodataStringGuesserHelp = f"""\
-Sets the level for the rodata C string guesser. Smaller values mean more conservative methods to guess a string, while higher values are more agressive. Level 0 (and negative) completely disables the guessing feature. Defaults to {self.RODATA_STRING_GUESSER_LEVEL}.
+    def _addBackendParametersToArgParse(self, parser: argparse.ArgumentParser):
+        backendConfig = parser.add_argument_group("Disassembler backend configuration")
 
-A C string must start at a 0x4-aligned region, which is '\\0' terminated and padded with '\\0's until a 0x4 boundary.
+        self._addBooleanArgument(backendConfig, "--disasm-unknown", "DISASSEMBLE_UNKNOWN_INSTRUCTIONS", "Force disassembling functions with unknown instructions.")
 
-- level 0: Completely disable the guessing feature.
-- level 1: The most conservative guessing level. Imposes the following restrictions:
-    - Do not try to guess if the user provided a type for the symbol.
-    - Do no try to guess if type information for the symbol can be inferred by other means.
-    - A string symbol must be referenced only once.
-    - Strings must not be empty.
-- level 2: A string no longer needs to be referenced only once to be considered a possible string. This can happen because of a deduplication optimization.
-- level 3: Empty strings are allowed.
-- level 4: Symbols with autodetected type information but no user type information can still be guessed as strings.
-"""
+        rodataStringGuesserHelp = f"Sets the level for the rodata C string guesser. Smaller values mean more conservative methods to guess a string, while higher values are more agressive. Level 0 (and negative) completely disables the guessing feature. Defaults to {self.RODATA_STRING_GUESSER_LEVEL}.\n\n{_stringGuesserLevelsHelp}"
         backendConfig.add_argument("--rodata-string-guesser", help=rodataStringGuesserHelp, type=int, metavar="level")
         backendConfig.add_argument("--data-string-guesser", help=f"Sets the level for the data C string guesser. See the explanation of `--rodata-string-guesser`. Defaults to {self.DATA_STRING_GUESSER_LEVEL}.", type=int, metavar="level")
 
         backendConfig.add_argument("--pascal-rodata-string-guesser", help=f"EXPERIMENTAL, this feature may change or be removed in the future. Sets the level for the data Pascal string guesser. See the explanation of `--rodata-string-guesser`. Defaults to {self.PASCAL_RODATA_STRING_GUESSER_LEVEL}.", type=int, metavar="level")
         backendConfig.add_argument("--pascal-data-string-guesser", help=f"EXPERIMENTAL, this feature may change or be removed in the future. Sets the level for the data Pascal string guesser. See the explanation of `--rodata-string-guesser`. Defaults to {self.PASCAL_DATA_STRING_GUESSER_LEVEL}.", type=int, metavar="level")
 
-        backendConfig.add_argument("--string-guesser", help=f"DEPRECATED, prefer `--rodata-string-guesser`. Toggles the string guesser feature. Defaults to {self.STRING_GUESSER}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--aggressive-string-guesser", help=f"DEPRECATED, prefer `--rodata-string-guesser`. Makes the string guesser feature to be more aggressive when trying to detect strings. Requires `--string-guesser` to be enabled. Defaults to {self.AGGRESSIVE_STRING_GUESSER}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--string-guesser", "STRING_GUESSER", "DEPRECATED, prefer `--rodata-string-guesser`. Toggles the string guesser feature.")
+        self._addBooleanArgument(backendConfig, "--aggressive-string-guesser", "AGGRESSIVE_STRING_GUESSER", "DEPRECATED, prefer `--rodata-string-guesser`. Makes the string guesser feature to be more aggressive when trying to detect strings. Requires `--string-guesser` to be enabled.")
 
 
-        backendConfig.add_argument("--name-vars-by-section", help=f"Toggles the naming-after-section feature for autogenerated names. This means autogenerated symbols get a RO_ or B_ prefix if the symbol is from a rodata or bss section. Defaults to {self.AUTOGENERATED_NAMES_BASED_ON_SECTION_TYPE}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--name-vars-by-type", help=f"Toggles the naming-after-type feature for autogenerated names. This means autogenerated symbols can get a STR_, FLT_ or DBL_ prefix if the symbol is a string, float or double. Defaults to {self.AUTOGENERATED_NAMES_BASED_ON_DATA_TYPE}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--name-vars-by-section", "AUTOGENERATED_NAMES_BASED_ON_SECTION_TYPE", "Toggles the naming-after-section feature for autogenerated names. This means autogenerated symbols get a RO_ or B_ prefix if the symbol is from a rodata or bss section.")
+        self._addBooleanArgument(backendConfig, "--name-vars-by-type", "AUTOGENERATED_NAMES_BASED_ON_DATA_TYPE", "Toggles the naming-after-type feature for autogenerated names. This means autogenerated symbols can get a STR_, FLT_ or DBL_ prefix if the symbol is a string, float or double.")
 
         backendConfig.add_argument("--custom-suffix", help="Set a custom suffix for automatically generated symbols")
 
         backendConfig.add_argument("--compiler", help=f"Enables some tweaks for the selected compiler. Defaults to {self.COMPILER.name}", choices=compilerOptions)
-        backendConfig.add_argument("--detect-redundant-function-end", help=f"Tries to detect redundant and unreferenced function ends (jr $ra; nop), and merge it into the previous function. Currently it only is applied when the compiler is set to IDO. Defaults to {self.DETECT_REDUNDANT_FUNCTION_END}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--detect-redundant-function-end", "DETECT_REDUNDANT_FUNCTION_END", "Tries to detect redundant and unreferenced function ends (jr $ra; nop), and merge it into the previous function. Currently it only is applied when the compiler is set to IDO.")
 
         backendConfig.add_argument("--endian", help=f"Set the endianness of input files. Defaults to {self.ENDIAN.name.lower()}", choices=["big", "little", "middle"], default=self.ENDIAN.name.lower())
 
@@ -322,59 +432,59 @@ A C string must start at a 0x4-aligned region, which is '\\0' terminated and pad
 
 
         backendConfig.add_argument("--gp", help="Set the value used for loads and stores related to the $gp register. A hex value is expected")
-        backendConfig.add_argument("--pic", help=f"Enables PIC analysis and the usage of some rel types, like %%got. Defaults to {self.PIC}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--emit-cpload", help=f"Emits a .cpload directive instead of the corresponding instructions if it were detected on PIC binaries. Defaults to {self.EMIT_CPLOAD}", action=Utils.BooleanOptionalAction)
-
-        backendConfig.add_argument("--emit-inline-reloc", help=f"Emit a comment indicating the relocation in each instruction/word. Defaults to {self.EMIT_INLINE_RELOC}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--pic", "PIC", "Enables PIC analysis and the usage of some rel types, like %%got.")
+        self._addBooleanArgument(backendConfig, "--emit-cpload", "EMIT_CPLOAD", "Emits a .cpload directive instead of the corresponding instructions if it were detected on PIC binaries.")
 
-        backendConfig.add_argument("--filter-low-addresses", help=f"Filter out low addresses (lower than 0x40000000) when searching for pointers. Defaults to {self.SYMBOL_FINDER_FILTER_LOW_ADDRESSES}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--filter-high-addresses", help=f"Filter out high addresses (higher than 0xC0000000) when searching for pointers. Defaults to {self.SYMBOL_FINDER_FILTER_HIGH_ADDRESSES}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--filtered-addresses-as-constants", help=f"Treat filtered out addressed as constants. Defaults to {self.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_CONSTANTS}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--filtered-addresses-as-hilo", help=f"Use %%hi/%%lo syntax for filtered out addresses. Defaults to {self.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--emit-inline-reloc", "EMIT_INLINE_RELOC", "Emit a comment indicating the relocation in each instruction/word.")
 
-        backendConfig.add_argument("--allow-unksegment", help=f"Allow using symbols from the unknown segment. Defaults to {self.ALLOW_UNKSEGMENT}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--filter-low-addresses", "SYMBOL_FINDER_FILTER_LOW_ADDRESSES", "Filter out low addresses (lower than 0x40000000) when searching for pointers.")
+        self._addBooleanArgument(backendConfig, "--filter-high-addresses", "SYMBOL_FINDER_FILTER_HIGH_ADDRESSES", "Filter out high addresses (higher than 0xC0000000) when searching for pointers.")
+        self._addBooleanArgument(backendConfig, "--filtered-addresses-as-constants", "SYMBOL_FINDER_FILTERED_ADDRESSES_AS_CONSTANTS", "Treat filtered out addressed as constants.")
+        self._addBooleanArgument(backendConfig, "--filtered-addresses-as-hilo", "SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO", "Use %%hi/%%lo syntax for filtered out addresses.")
 
-        backendConfig.add_argument("--allow-all-addends-on-data", help=f"Enable using addends on symbols referenced by data. Defaults to {self.ALLOW_ALL_ADDENDS_ON_DATA}", action=Utils.BooleanOptionalAction)
-        backendConfig.add_argument("--allow-all-constants-on-data", help=f"Enable referencing constants by data. Defaults to {self.ALLOW_ALL_CONSTANTS_ON_DATA}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(backendConfig, "--allow-unksegment", "ALLOW_UNKSEGMENT", "Allow using symbols from the unknown segment.")
 
+        self._addBooleanArgument(backendConfig, "--allow-all-addends-on-data", "ALLOW_ALL_ADDENDS_ON_DATA", "Enable using addends on symbols referenced by data.")
+        self._addBooleanArgument(backendConfig, "--allow-all-constants-on-data", "ALLOW_ALL_CONSTANTS_ON_DATA", "Enable referencing constants by data.")
 
+    def _addMiscParametersToArgParse(self, parser: argparse.ArgumentParser):
         miscConfig = parser.add_argument_group("Disassembler misc options")
 
-        miscConfig.add_argument("--asm-comments", help=f"Toggle the comments in generated assembly code. Defaults to {self.ASM_COMMENT}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--comment-offset-width", help=f"Sets the zeroes width padding for the file offset comment. Defaults to {self.ASM_COMMENT_OFFSET_WIDTH}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--glabel-count", help=f"Toggle glabel count comment. Defaults to {self.GLABEL_ASM_COUNT}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--asm-referencee-symbols", help=f"Toggle glabel count comment. Defaults to {self.ASM_REFERENCEE_SYMBOLS}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--asm-comments", "ASM_COMMENT", "Toggle the comments in generated assembly code.")
+        self._addBooleanArgument(miscConfig, "--comment-offset-width", "ASM_COMMENT_OFFSET_WIDTH", "Sets the zeroes width padding for the file offset comment.")
+        self._addBooleanArgument(miscConfig, "--glabel-count", "GLABEL_ASM_COUNT", "Toggle glabel count comment.")
+        self._addBooleanArgument(miscConfig, "--asm-referencee-symbols", "ASM_REFERENCEE_SYMBOLS", "Toggle glabel count comment.")
 
         miscConfig.add_argument("--asm-text-label", help=f"Changes the label used to declare functions. Defaults to {self.ASM_TEXT_LABEL}")
         miscConfig.add_argument("--asm-text-alt-label", help=f"Changes the label used to declare symbols in the middle of functions. Defaults to {self.ASM_TEXT_ALT_LABEL}")
         miscConfig.add_argument("--asm-jtbl-label", help=f"Changes the label used to declare jumptable labels. Defaults to {self.ASM_JTBL_LABEL}")
         miscConfig.add_argument("--asm-data-label", help=f"Changes the label used to declare data symbols. Defaults to {self.ASM_DATA_LABEL}")
-        miscConfig.add_argument("--asm-use-symbol-label", help=f"Toggles the use of labels for symbols. Defaults to {self.ASM_USE_SYMBOL_LABEL}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--asm-use-symbol-label", "ASM_USE_SYMBOL_LABEL", "Toggles the use of labels for symbols.")
         miscConfig.add_argument("--asm-ent-label", help=f"Tells the disassembler to start using an ent label for functions")
         miscConfig.add_argument("--asm-end-label", help=f"Tells the disassembler to start using an end label for functions")
-        miscConfig.add_argument("--asm-func-as-label", help=f"Toggle adding the function name as an additional label. Defaults to {self.ASM_TEXT_FUNC_AS_LABEL}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--asm-data-as-label", help=f"Toggle adding the data symbol name as an additional label. Defaults to {self.ASM_DATA_SYM_AS_LABEL}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--asm-emit-size-directive", help=f"Toggles emitting a size directive to generated symbols. Defaults to {self.ASM_EMIT_SIZE_DIRECTIVE}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--asm-use-prelude", help=f"Toggle use of the default prelude for asm files. Defaults to {self.ASM_USE_PRELUDE}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--asm-generated-by", help=f"Toggle comment indicating the tool and version used to generate the disassembly. Defaults to {self.ASM_GENERATED_BY}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--asm-func-as-label", "ASM_TEXT_FUNC_AS_LABEL", "Toggle adding the function name as an additional label.")
+        self._addBooleanArgument(miscConfig, "--asm-data-as-label", "ASM_DATA_SYM_AS_LABEL", "Toggle adding the data symbol name as an additional label.")
+        self._addBooleanArgument(miscConfig, "--asm-emit-size-directive", "ASM_EMIT_SIZE_DIRECTIVE", "Toggles emitting a size directive to generated symbols.")
+        self._addBooleanArgument(miscConfig, "--asm-use-prelude", "ASM_USE_PRELUDE", "Toggle use of the default prelude for asm files.")
+        self._addBooleanArgument(miscConfig, "--asm-generated-by", "ASM_GENERATED_BY", "Toggle comment indicating the tool and version used to generate the disassembly.")
 
-        miscConfig.add_argument("--print-new-file-boundaries", help=f"Print to stdout any new file boundary found. Defaults to {self.PRINT_NEW_FILE_BOUNDARIES}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--print-new-file-boundaries", "PRINT_NEW_FILE_BOUNDARIES", "Print to stdout any new file boundary found.")
 
-        miscConfig.add_argument("--use-dot-byte", help=f"Disassemble symbols marked as bytes with .byte instead of .word. Defaults to {self.USE_DOT_BYTE}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--use-dot-short", help=f"Disassemble symbols marked as shorts with .short instead of .word. Defaults to {self.USE_DOT_SHORT}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--use-dot-byte", "USE_DOT_BYTE", "Disassemble symbols marked as bytes with .byte instead of .word.")
+        self._addBooleanArgument(miscConfig, "--use-dot-short", "USE_DOT_SHORT", "Disassemble symbols marked as shorts with .short instead of .word.")
 
-        miscConfig.add_argument("--panic-range-check", help=f"Produce a fatal error if a range check fails instead of just printing a warning. Defaults to {self.PANIC_RANGE_CHECK}", action=Utils.BooleanOptionalAction)
-
-        miscConfig.add_argument("--create-data-pads", help=f"Create dummy and unreferenced data symbols after another symbol which has non-zero user-declared size.\nThe generated pad symbols may have non-zero data. Defaults to {self.CREATE_DATA_PADS}", action=Utils.BooleanOptionalAction)
-        miscConfig.add_argument("--create-rodata-pads", help=f"Create dummy and unreferenced rodata symbols after another symbol which has non-zero user-declared size.\nThe generated pad symbols may have non-zero data. Defaults to {self.CREATE_RODATA_PADS}", action=Utils.BooleanOptionalAction)
+        self._addBooleanArgument(miscConfig, "--panic-range-check", "PANIC_RANGE_CHECK", "Produce a fatal error if a range check fails instead of just printing a warning.")
 
+        self._addBooleanArgument(miscConfig, "--create-data-pads", "CREATE_DATA_PADS", "Create dummy and unreferenced data symbols after another symbol which has non-zero user-declared size.\nThe generated pad symbols may have non-zero data.")
+        self._addBooleanArgument(miscConfig, "--create-rodata-pads", "CREATE_RODATA_PADS", "Create dummy and unreferenced rodata symbols after another symbol which has non-zero user-declared size.\nThe generated pad symbols may have non-zero data.")
 
+    def _addVerbosityParametersToArgParse(self, parser: argparse.ArgumentParser):
         verbosityConfig = parser.add_argument_group("Verbosity options")
 
         verbosityConfig.add_argument("-v", "--verbose", help="Enable verbose mode", action=Utils.BooleanOptionalAction)
         verbosityConfig.add_argument("-q", "--quiet", help="Silence most of the output", action=Utils.BooleanOptionalAction)
 
-
+    def _addDebuggingParametersToArgParse(self, parser: argparse.ArgumentParser):
         debugging = parser.add_argument_group("Disassembler debugging options")
 
         debugging.add_argument("--debug-func-analysis", help="Enables some debug info printing related to the function analysis)", action=Utils.BooleanOptionalAction)
@@ -423,38 +533,20 @@ A C string must start at a 0x4-aligned region, which is '\\0' terminated and pad
             setattr(self, attr, environmentValue)
 
     def parseArgs(self, args: argparse.Namespace):
-        if args.disasm_unknown is not None:
-            self.DISASSEMBLE_UNKNOWN_INSTRUCTIONS = args.disasm_unknown
-
-        if args.rodata_string_guesser is not None:
-            self.RODATA_STRING_GUESSER_LEVEL = args.rodata_string_guesser
-        if args.data_string_guesser is not None:
-            self.DATA_STRING_GUESSER_LEVEL = args.data_string_guesser
-
-        if args.pascal_rodata_string_guesser is not None:
-            self.PASCAL_RODATA_STRING_GUESSER_LEVEL = args.pascal_rodata_string_guesser
-        if args.pascal_data_string_guesser is not None:
-            self.PASCAL_DATA_STRING_GUESSER_LEVEL = args.pascal_data_string_guesser
+        for argName, attrName in _argsToAttrs:
+            value = getattr(args, argName)
+            if value is not None:
+                setattr(self, attrName, value)
 
-        if args.string_guesser is not None:
-            self.STRING_GUESSER = args.string_guesser
-        if args.aggressive_string_guesser is not None:
-            self.AGGRESSIVE_STRING_GUESSER = args.aggressive_string_guesser
-
-        if args.name_vars_by_section is not None:
-            self.AUTOGENERATED_NAMES_BASED_ON_SECTION_TYPE = args.name_vars_by_section
-        if args.name_vars_by_type is not None:
-            self.AUTOGENERATED_NAMES_BASED_ON_DATA_TYPE = args.name_vars_by_type
-
-        if args.custom_suffix:
-            self.CUSTOM_SUFFIX = args.custom_suffix
+        for argName, attrName in _nonEmptyArgsToAttrs:
+            value = getattr(args, argName)
+            if value:
+                # Interning dedups the argv strings against equal ones already in the interpreter, like the default literals
+                setattr(self, attrName, sys.intern(value))
 
         if args.compiler is not None:
             self.COMPILER = Compiler.fromStr(args.compiler)
 
-        if args.detect_redundant_function_end is not None:
-            self.DETECT_REDUNDANT_FUNCTION_END = args.detect_redundant_function_end
-
         if args.endian is not None:
             self.ENDIAN = InputEndian.fromStr(args.endian)
 
@@ -467,95 +559,7 @@ A C string must start at a 0x4-aligned region, which is '\\0' terminated and pad
 
         if args.gp is not None:
             self.GP_VALUE = int(args.gp, 16)
-        if args.pic is not None:
-            self.PIC = args.pic
-        if args.emit_cpload is not None:
-            self.EMIT_CPLOAD = args.emit_cpload
-
-        if args.emit_inline_reloc is not None:
-            self.EMIT_INLINE_RELOC = args.emit_inline_reloc
-
-        if args.filter_low_addresses is not None:
-            self.SYMBOL_FINDER_FILTER_LOW_ADDRESSES = args.filter_low_addresses
-        if args.filter_high_addresses is not None:
-            self.SYMBOL_FINDER_FILTER_HIGH_ADDRESSES = args.filter_high_addresses
-        if args.filtered_addresses_as_constants is not None:
-            self.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_CONSTANTS = args.filtered_addresses_as_constants
-        if args.filtered_addresses_as_hilo is not None:
-            self.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO = args.filtered_addresses_as_hilo
-
-        if args.allow_unksegment is not None:
-            self.ALLOW_UNKSEGMENT = args.allow_unksegment
-
-        if args.allow_all_addends_on_data is not None:
-            self.ALLOW_ALL_ADDENDS_ON_DATA = args.allow_all_addends_on_data
-        if args.allow_all_constants_on_data is not None:
-            self.ALLOW_ALL_CONSTANTS_ON_DATA = args.allow_all_constants_on_data
-
-
-        if args.asm_comments is not None:
-            self.ASM_COMMENT = args.asm_comments
-        if args.comment_offset_width is not None:
-            self.ASM_COMMENT_OFFSET_WIDTH = args.comment_offset_width
-        if args.glabel_count is not None:
-            self.GLABEL_ASM_COUNT = args.glabel_count
-        if args.asm_referencee_symbols is not None:
-            self.ASM_REFERENCEE_SYMBOLS = args.asm_referencee_symbols
-
-        if args.asm_text_label:
-            self.ASM_TEXT_LABEL = args.asm_text_label
-        if args.asm_text_alt_label:
-            self.ASM_TEXT_ALT_LABEL = args.asm_text_alt_label
-        if args.asm_jtbl_label:
-            self.ASM_JTBL_LABEL = args.asm_jtbl_label
-        if args.asm_data_label:
-            self.ASM_DATA_LABEL = args.asm_data_label
-        if args.asm_use_symbol_label is not None:
-            self.ASM_USE_SYMBOL_LABEL = args.asm_use_symbol_label
-        if args.asm_ent_label:
-            self.ASM_TEXT_ENT_LABEL = args.asm_ent_label
-        if args.asm_end_label:
-            self.ASM_TEXT_END_LABEL = args.asm_end_label
-        if args.asm_func_as_label is not None:
-            self.ASM_TEXT_FUNC_AS_LABEL = args.asm_func_as_label
-        if args.asm_data_as_label is not None:
-            self.ASM_DATA_SYM_AS_LABEL = args.asm_data_as_label
-        if args.asm_emit_size_directive is not None:
-            self.ASM_EMIT_SIZE_DIRECTIVE = args.asm_emit_size_directive
-        if args.asm_use_prelude is not None:
-            self.ASM_USE_PRELUDE = args.asm_use_prelude
-        if args.asm_generated_by is not None:
-            self.ASM_GENERATED_BY = args.asm_generated_by
-
-        if args.print_new_file_boundaries is not None:
-            self.PRINT_NEW_FILE_BOUNDARIES = args.print_new_file_boundaries
-
-        if args.use_dot_byte is not None:
-            self.USE_DOT_BYTE = args.use_dot_byte
-        if args.use_dot_short is not None:
-            self.USE_DOT_SHORT = args.use_dot_short
-
-        if args.panic_range_check is not None:
-            self.PANIC_RANGE_CHECK = args.panic_range_check
-
-        if args.create_data_pads is not None:
-            self.CREATE_DATA_PADS = args.create_data_pads
-        if args.create_rodata_pads is not None:
-            self.CREATE_RODATA_PADS = args.create_rodata_pads
-
-
-        if args.verbose is not None:
-            self.VERBOSE = args.verbose
-        if args.quiet is not None:
-            self.QUIET = args.quiet
-
-
-        if args.debug_func_analysis is not None:
-            self.PRINT_FUNCTION_ANALYSIS_DEBUG_INFO = args.debug_func_analysis
-        if args.debug_symbol_finder is not None:
-            self.PRINT_SYMBOL_FINDER_DEBUG_INFO = args.debug_symbol_finder
-        if args.debug_unpaired_luis is not None:
-            self.PRINT_UNPAIRED_LUIS_DEBUG_INFO = args.debug_unpaired_luis
+
 
 GlobalConfig = GlobalConfigType()
 
@@ -14,6 +14,7 @@ import rabbitizer
 import struct
 import subprocess
 import sys
+from typing import Any, Callable
 
 from .GlobalConfig import GlobalConfig, InputEndian
 
@@ -433,6 +434,43 @@ class BooleanOptionalAction(argparse.Action):
     def format_usage(self):
         return ' | '.join(self.option_strings)
 
+class LazyArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser which defers adding its options until it is actually used.
+
+    Useful for subparsers, since building every subcommand's options upfront is
+    wasted work when only one of them (or none, like for `--help`) gets used."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._optionsAdder: Callable[[argparse.ArgumentParser], Any]|None = None
+
+    def setOptionsAdder(self, optionsAdder: Callable[[argparse.ArgumentParser], Any]) -> None:
+        self._optionsAdder = optionsAdder
+
+    def _addPendingOptions(self) -> None:
+        if self._optionsAdder is not None:
+            optionsAdder = self._optionsAdder
+            self._optionsAdder = None
+            optionsAdder(self)
+
+    def parse_known_args(self, args=None, namespace=None):
+        self._addPendingOptions()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self):
+        self._addPendingOptions()
+        return super().format_usage()
+
+    def format_help(self):
+        self._addPendingOptions()
+        return super().format_help()
+
+def addOptionsToParserLazily(parser: argparse.ArgumentParser, optionsAdder: Callable[[argparse.ArgumentParser], Any]) -> None:
+    if isinstance(parser, LazyArgumentParser):
+        parser.setOptionsAdder(optionsAdder)
+    else:
+        optionsAdder(parser)
+
 # https://stackoverflow.com/a/35925919/6292472
 class PreserveWhiteSpaceWrapRawTextHelpFormatter(argparse.RawDescriptionHelpFormatter):
     def __add_whitespace(self, idx, iWSpace, text):
@@ -38,7 +38,7 @@ def getArgsParser() -> argparse.ArgumentParser:
 
 
 def applyArgs(args: argparse.Namespace) -> None:
-    common.GlobalConfig.ENDIAN = common.InputEndian(args.endian)
+    common.GlobalConfig.ENDIAN = common.InputEndian.fromStr(args.endian)
     if args.pseudos:
         rabbitizer.config.pseudos_enablePseudos = True
     else:
@@ -106,7 +106,7 @@ def processArguments(args: argparse.Namespace) -> int:
 def addSubparser(subparser: argparse._SubParsersAction[argparse.ArgumentParser]):
     parser = subparser.add_parser("disasmdis", help=getToolDescription(), formatter_class=common.Utils.PreserveWhiteSpaceWrapRawTextHelpFormatter)
 
-    addOptionsToParser(parser)
+    common.Utils.addOptionsToParserLazily(parser, addOptionsToParser)
 
     parser.set_defaults(func=processArguments)
 
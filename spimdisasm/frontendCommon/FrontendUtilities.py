@@ -259,7 +259,7 @@ def cliMain():
 
     parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
 
-    subparsers = parser.add_subparsers(description="action", help="The CLI utility to run", required=True)
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser] = parser.add_subparsers(description="action", help="The CLI utility to run", required=True, parser_class=common.Utils.LazyArgumentParser)
 
     spimdisasm.disasmdis.addSubparser(subparsers)
     spimdisasm.singleFileDisasm.addSubparser(subparsers)
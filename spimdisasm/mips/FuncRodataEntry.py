@@ -25,17 +25,19 @@ class FunctionRodataEntry:
         return len(self.rodataSyms) > 0 or len(self.lateRodataSyms) > 0
 
     def writeToFile(self, f: TextIO, writeFunction: bool=True):
+        lineEnds = common.GlobalConfig.LINE_ENDS
+
         if len(self.rodataSyms) > 0:
             # Write the rdata
-            f.write(f".section .rodata{common.GlobalConfig.LINE_ENDS}")
+            f.write(f".section .rodata{lineEnds}")
             for sym in self.rodataSyms:
                 f.write(sym.disassemble(migrate=True, useGlobalLabel=True, isSplittedSymbol=True))
-                f.write(common.GlobalConfig.LINE_ENDS)
+                f.write(lineEnds)
 
         if len(self.lateRodataSyms) > 0:
             assert self.function is not None
             # Write the late_rodata
-            f.write(f".section .late_rodata{common.GlobalConfig.LINE_ENDS}")
+            f.write(f".section .late_rodata{lineEnds}")
 
             lateRodataSize = 0
             for sym in self.lateRodataSyms:
@@ -46,14 +48,14 @@ class FunctionRodataEntry:
                 firstLateRodataVram = self.lateRodataSyms[0].vram
                 if firstLateRodataVram is not None and firstLateRodataVram % 8 == 0:
                     align = 8
-                f.write(f".late_rodata_alignment {align}{common.GlobalConfig.LINE_ENDS}")
+                f.write(f".late_rodata_alignment {align}{lineEnds}")
             for sym in self.lateRodataSyms:
                 f.write(sym.disassemble(migrate=True, useGlobalLabel=True, isSplittedSymbol=True))
-                f.write(common.GlobalConfig.LINE_ENDS)
+                f.write(lineEnds)
 
         if self.function is not None:
             if len(self.rodataSyms) > 0 or len(self.lateRodataSyms) > 0:
-                f.write(f"{common.GlobalConfig.LINE_ENDS}.section .text{common.GlobalConfig.LINE_ENDS}")
+                f.write(f"{lineEnds}.section .text{lineEnds}")
 
             if writeFunction:
                 # Write the function itself
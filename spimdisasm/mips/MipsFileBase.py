@@ -41,18 +41,19 @@ class FileBase(common.ElementBase):
 
     def getAsmPrelude(self) -> str:
         output = ""
+        lineEnds = common.GlobalConfig.LINE_ENDS
 
-        output += ".include \"macro.inc\"" + common.GlobalConfig.LINE_ENDS
-        output += common.GlobalConfig.LINE_ENDS
-        output += "# assembler directives" + common.GlobalConfig.LINE_ENDS
-        output += ".set noat      # allow manual use of $at" + common.GlobalConfig.LINE_ENDS
-        output += ".set noreorder # don't insert nops after branches" + common.GlobalConfig.LINE_ENDS
+        output += ".include \"macro.inc\"" + lineEnds
+        output += lineEnds
+        output += "# assembler directives" + lineEnds
+        output += ".set noat      # allow manual use of $at" + lineEnds
+        output += ".set noreorder # don't insert nops after branches" + lineEnds
         if common.GlobalConfig.ARCHLEVEL >= common.ArchLevel.MIPS3:
-            output += ".set gp=64     # allow use of 64-bit general purpose registers" + common.GlobalConfig.LINE_ENDS
-        output += common.GlobalConfig.LINE_ENDS
-        output += f".section {self.getSectionName()}" + common.GlobalConfig.LINE_ENDS
-        output += common.GlobalConfig.LINE_ENDS
-        output += ".align 4" + common.GlobalConfig.LINE_ENDS
+            output += ".set gp=64     # allow use of 64-bit general purpose registers" + lineEnds
+        output += lineEnds
+        output += f".section {self.getSectionName()}" + lineEnds
+        output += lineEnds
+        output += ".align 4" + lineEnds
 
         return output
 
@@ -162,10 +163,8 @@ class FileBase(common.ElementBase):
         if not migrate:
             output += self.getSpimdisasmVersionString()
 
-        for i, sym in enumerate(self.symbolList):
-            output += sym.disassemble(migrate=migrate, useGlobalLabel=useGlobalLabel, isSplittedSymbol=False)
-            if i + 1 < len(self.symbolList):
-                output += common.GlobalConfig.LINE_ENDS
+        # Join every symbol at once instead of concatenating them one by one
+        output += common.GlobalConfig.LINE_ENDS.join(sym.disassemble(migrate=migrate, useGlobalLabel=useGlobalLabel, isSplittedSymbol=False) for sym in self.symbolList)
         return output
 
     def disassembleToFile(self, f: TextIO):
@@ -132,14 +132,15 @@ class SectionBase(FileBase):
             return False
 
         was_updated = False
-        if len(common.GlobalConfig.IGNORE_WORD_LIST) > 0:
+        ignoreWordList = common.GlobalConfig.IGNORE_WORD_LIST
+        if len(ignoreWordList) > 0:
             min_len = min(self.sizew, other.sizew)
             for i in range(min_len):
-                for upperByte in common.GlobalConfig.IGNORE_WORD_LIST:
+                upperByte = (self.words[i] >> 24) & 0xFF
+                if upperByte in ignoreWordList and ((other.words[i] >> 24) & 0xFF) == upperByte:
                     word = upperByte << 24
-                    if ((self.words[i] >> 24) & 0xFF) == upperByte and ((other.words[i] >> 24) & 0xFF) == upperByte:
-                        self.words[i] = word
-                        other.words[i] = word
-                        was_updated = True
+                    self.words[i] = word
+                    other.words[i] = word
+                    was_updated = True
 
         return was_updated
@@ -281,6 +281,7 @@ class SymbolBase(common.ElementBase):
 
     def getNthWordAsBytesAndShorts(self, i: int, sym1: common.ContextSymbol|None, sym2: common.ContextSymbol|None, sym3: common.ContextSymbol|None, lastSymName: str) -> tuple[str, int]:
         output = ""
+        lineEnds = common.GlobalConfig.LINE_ENDS
 
         # Check the 4 bytes of this word to determine if each pair of bytes should be disassembled as `.short`s or a pair of `.byte`s
 
@@ -292,7 +293,7 @@ class SymbolBase(common.ElementBase):
             # Otherwise, disassemble as short
 
             output += self.getJByteAsByte(i, 0)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
 
             if sym1 is not None:
                 output += self.getSizeDirective(lastSymName)
@@ -300,10 +301,10 @@ class SymbolBase(common.ElementBase):
 
             output += self.getExtraLabelFromSymbol(sym1)
             output += self.getJByteAsByte(i, 1)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
         else:
             output += self.getJByteAsShort(i, 0)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
 
         if sym2 is not None:
             output += self.getSizeDirective(lastSymName)
@@ -318,7 +319,7 @@ class SymbolBase(common.ElementBase):
             # Otherwise, disassemble as short
 
             output += self.getJByteAsByte(i, 2)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
 
             if sym3 is not None:
                 output += self.getSizeDirective(lastSymName)
@@ -326,10 +327,10 @@ class SymbolBase(common.ElementBase):
 
             output += self.getExtraLabelFromSymbol(sym3)
             output += self.getJByteAsByte(i, 3)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
         else:
             output += self.getJByteAsShort(i, 2)
-            output += common.GlobalConfig.LINE_ENDS
+            output += lineEnds
 
         return output, 0
 
@@ -468,12 +469,13 @@ class SymbolBase(common.ElementBase):
         if not common.GlobalConfig.ASM_COMMENT:
             commentPaddingNum = 1
 
+        lineEnds = common.GlobalConfig.LINE_ENDS
         if rawStringSize == 0:
             decodedStrings.append("")
         for decodedValue in decodedStrings[:-1]:
             result += f'.ascii "{decodedValue}"'
-            result += common.GlobalConfig.LINE_ENDS + (commentPaddingNum * " ")
-        result += f'.asciz "{decodedStrings[-1]}"{common.GlobalConfig.LINE_ENDS}'
+            result += lineEnds + (commentPaddingNum * " ")
+        result += f'.asciz "{decodedStrings[-1]}"{lineEnds}'
 
         return result, skip
 
@@ -493,12 +495,13 @@ class SymbolBase(common.ElementBase):
         if not common.GlobalConfig.ASM_COMMENT:
             commentPaddingNum = 1
 
+        lineEnds = common.GlobalConfig.LINE_ENDS
         if rawStringSize == 0:
             decodedStrings.append("")
         for decodedValue in decodedStrings[:-1]:
             result += f'.ascii "{decodedValue}"'
-            result += common.GlobalConfig.LINE_ENDS + (commentPaddingNum * " ")
-        result += f'.ascii "{decodedStrings[-1]}"{common.GlobalConfig.LINE_ENDS}'
+            result += lineEnds + (commentPaddingNum * " ")
+        result += f'.ascii "{decodedStrings[-1]}"{lineEnds}'
 
         return result, skip
 
@@ -554,6 +557,7 @@ class SymbolBase(common.ElementBase):
 
         canReferenceSymbolsWithAddends = self.canUseAddendsOnData()
         canReferenceConstants = self.canUseConstantsOnData()
+        emitInlineReloc = common.GlobalConfig.EMIT_INLINE_RELOC
 
         i = 0
         while i < self.sizew:
@@ -596,7 +600,7 @@ class SymbolBase(common.ElementBase):
             if i != 0:
                 output += self.getPrevAlignDirective(i)
             output += data
-            if common.GlobalConfig.EMIT_INLINE_RELOC:
+            if emitInlineReloc:
                 relocInfo = self.getReloc(i*4, None)
                 output += self.relocToInlineStr(relocInfo, isSplittedSymbol)
             output += self.getPostAlignDirective(i)
@@ -77,19 +77,23 @@ class SymbolFunction(SymbolText):
 
     def _runInstructionAnalyzer(self):
         regsTracker = rabbitizer.RegistersTracker()
+        disassembleUnknownInstructions = common.GlobalConfig.DISASSEMBLE_UNKNOWN_INSTRUCTIONS
+        # The debug printing lives in its own method, so skip even calling it unless it was requested
+        printAnalysisDebugInfo = common.GlobalConfig.PRINT_FUNCTION_ANALYSIS_DEBUG_INFO
 
         instructionOffset = 0
         for instr in self.instructions:
             currentVram = self.getVramOffset(instructionOffset)
             prevInstr = self.instructions[instructionOffset//4 - 1]
 
-            self.instrAnalyzer.printAnalisisDebugInfo_IterInfo(regsTracker, instr, currentVram)
+            if printAnalysisDebugInfo:
+                self.instrAnalyzer.printAnalisisDebugInfo_IterInfo(regsTracker, instr, currentVram)
 
             if instr.isLikelyHandwritten() and not self.isRsp:
                 self.isLikelyHandwritten = True
                 self.endOfLineComment[instructionOffset//4] = " # handwritten instruction"
 
-            if not common.GlobalConfig.DISASSEMBLE_UNKNOWN_INSTRUCTIONS and not instr.isImplemented():
+            if not disassembleUnknownInstructions and not instr.isImplemented():
                 # Abort analysis
                 self.hasUnimplementedIntrs = True
                 return
@@ -289,6 +293,10 @@ class SymbolFunction(SymbolText):
         return common.RelocType.MIPS_LO16
 
     def _generateRelocsFromInstructionAnalyzer(self):
+        # Only meaningful when PIC is enabled, so both flags are tested once here instead of per symbol
+        gpValue = common.GlobalConfig.GP_VALUE if common.GlobalConfig.PIC else None
+        filteredAddressesAsHilo = common.GlobalConfig.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO
+
         for instrOffset, address in self.instrAnalyzer.symbolInstrOffset.items():
             if self.context.isAddressBanned(address):
                 continue
@@ -297,9 +305,9 @@ class SymbolFunction(SymbolText):
 
             gotHiLo = False
             gotSmall = False
-            if contextSym is None and address < 0 and common.GlobalConfig.PIC and common.GlobalConfig.GP_VALUE is not None:
+            if contextSym is None and address < 0 and gpValue is not None:
                 # Negative pointer may mean it is a weird GOT access
-                gotAccess = common.GlobalConfig.GP_VALUE + address
+                gotAccess = gpValue + address
                 gpAccess = self.context.gpAccesses.requestAddress(gotAccess)
                 if gpAccess is not None:
                     address = gpAccess.address
@@ -336,7 +344,7 @@ class SymbolFunction(SymbolText):
             symbol = self.getConstant(constant)
             if symbol is not None:
                 self.relocs[instrOffset] = common.RelocationInfo(relocType, symbol.getName())
-            elif common.GlobalConfig.SYMBOL_FINDER_FILTERED_ADDRESSES_AS_HILO:
+            elif filteredAddressesAsHilo:
                 self.relocs[instrOffset] = common.RelocationInfo(relocType, f"0x{constant:X}")
             else:
                 # Pretend this pair is a constant
@@ -372,9 +380,11 @@ class SymbolFunction(SymbolText):
         self._postProcessGotAccesses()
         self._processElfRelocSymbols()
 
+        isElfInput = common.GlobalConfig.INPUT_FILE_TYPE == common.InputFileType.ELF
+
         # Branches
         for instrOffset, targetBranchVram in self.instrAnalyzer.branchInstrOffsets.items():
-            if common.GlobalConfig.INPUT_FILE_TYPE == common.InputFileType.ELF:
+            if isElfInput:
                 if self.getVromOffset(instrOffset) in self.context.globalRelocationOverrides:
                     # Avoid creating wrong symbols on elf files
                     continue
@@ -385,7 +395,7 @@ class SymbolFunction(SymbolText):
 
         # Function calls
         for instrOffset, targetVram in self.instrAnalyzer.funcCallInstrOffsets.items():
-            if common.GlobalConfig.INPUT_FILE_TYPE == common.InputFileType.ELF:
+            if isElfInput:
                 if self.getVromOffset(instrOffset) in self.context.globalRelocationOverrides:
                     # Avoid creating wrong symbols on elf files
                     continue
@@ -404,7 +414,7 @@ class SymbolFunction(SymbolText):
             if self.context.isAddressBanned(symVram):
                 continue
 
-            if common.GlobalConfig.INPUT_FILE_TYPE == common.InputFileType.ELF:
+            if isElfInput:
                 if self.getVromOffset(loOffset) in self.context.globalRelocationOverrides:
                     # Avoid creating wrong symbols on elf files
                     continue
@@ -716,6 +726,10 @@ class SymbolFunction(SymbolText):
         symSize = self.contextSym.getSize()
         output += self.getSymbolAsmDeclaration(symName, useGlobalLabel)
 
+        lineEnds = common.GlobalConfig.LINE_ENDS
+        emitInlineReloc = common.GlobalConfig.EMIT_INLINE_RELOC
+        asmTextEndLabel = common.GlobalConfig.ASM_TEXT_END_LABEL
+
         wasLastInstABranch = False
         instructionOffset = 0
         for instr in self.instructions:
@@ -729,9 +743,9 @@ class SymbolFunction(SymbolText):
 
             currentLine += self.getEndOfLineComment(instructionOffset//4)
             if currentLine != "":
-                currentLine += common.GlobalConfig.LINE_ENDS
+                currentLine += lineEnds
 
-            if common.GlobalConfig.EMIT_INLINE_RELOC:
+            if emitInlineReloc:
                 relocInfo = self.getReloc(instructionOffset, instr)
                 currentLine += self.relocToInlineStr(relocInfo, isSplittedSymbol=isSplittedSymbol)
 
@@ -741,8 +755,8 @@ class SymbolFunction(SymbolText):
             instructionOffset += 4
 
             if instructionOffset == symSize:
-                if common.GlobalConfig.ASM_TEXT_END_LABEL:
-                    output += f"{common.GlobalConfig.ASM_TEXT_END_LABEL} {self.getName()}" + common.GlobalConfig.LINE_ENDS
+                if asmTextEndLabel:
+                    output += f"{asmTextEndLabel} {self.getName()}" + lineEnds
 
                 output += self.getSizeDirective(symName)
 
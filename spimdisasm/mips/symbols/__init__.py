@@ -5,13 +5,56 @@
 
 from __future__ import annotations
 
-from . import analysis
+from typing import TYPE_CHECKING, Any
 
-from .MipsSymbolBase import SymbolBase as SymbolBase
+__all__ = (
+    "analysis",
 
-from .MipsSymbolText import SymbolText as SymbolText
-from .MipsSymbolData import SymbolData as SymbolData
-from .MipsSymbolRodata import SymbolRodata as SymbolRodata
-from .MipsSymbolBss import SymbolBss as SymbolBss
+    "SymbolBase",
 
-from .MipsSymbolFunction import SymbolFunction as SymbolFunction
+    "SymbolText",
+    "SymbolData",
+    "SymbolRodata",
+    "SymbolBss",
+
+    "SymbolFunction",
+)
+
+if TYPE_CHECKING:
+    from . import analysis
+
+    from .MipsSymbolBase import SymbolBase
+
+    from .MipsSymbolText import SymbolText
+    from .MipsSymbolData import SymbolData
+    from .MipsSymbolRodata import SymbolRodata
+    from .MipsSymbolBss import SymbolBss
+
+    from .MipsSymbolFunction import SymbolFunction
+
+
+# Everything is imported on first access (PEP 562), so only the modules which are actually used get loaded
+_lazySymbolModules: dict[str, str] = {
+    "SymbolBase": "MipsSymbolBase",
+
+    "SymbolText": "MipsSymbolText",
+    "SymbolData": "MipsSymbolData",
+    "SymbolRodata": "MipsSymbolRodata",
+    "SymbolBss": "MipsSymbolBss",
+
+    "SymbolFunction": "MipsSymbolFunction",
+}
+
+def __getattr__(name: str) -> Any:
+    import importlib
+
+    if name == "analysis":
+        return importlib.import_module(f".{name}", __name__)
+
+    moduleName = _lazySymbolModules.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{moduleName}", __name__), name)
+    globals()[name] = value
+    return value
@@ -238,9 +238,11 @@ class InstrAnalyzer:
         # filter out stuff that may not be a real symbol
         filterOut = False
         if not self.context.totalVramRange.isInRange(address):
-            if common.GlobalConfig.SYMBOL_FINDER_FILTER_LOW_ADDRESSES or common.GlobalConfig.SYMBOL_FINDER_FILTER_HIGH_ADDRESSES:
-                filterOut |= common.GlobalConfig.SYMBOL_FINDER_FILTER_LOW_ADDRESSES and address < common.GlobalConfig.SYMBOL_FINDER_FILTER_ADDRESSES_ADDR_LOW
-                filterOut |= common.GlobalConfig.SYMBOL_FINDER_FILTER_HIGH_ADDRESSES and address >= common.GlobalConfig.SYMBOL_FINDER_FILTER_ADDRESSES_ADDR_HIGH
+            filterLowAddresses = common.GlobalConfig.SYMBOL_FINDER_FILTER_LOW_ADDRESSES
+            filterHighAddresses = common.GlobalConfig.SYMBOL_FINDER_FILTER_HIGH_ADDRESSES
+            if filterLowAddresses or filterHighAddresses:
+                filterOut |= filterLowAddresses and address < common.GlobalConfig.SYMBOL_FINDER_FILTER_ADDRESSES_ADDR_LOW
+                filterOut |= filterHighAddresses and address >= common.GlobalConfig.SYMBOL_FINDER_FILTER_ADDRESSES_ADDR_HIGH
             else:
                 filterOut |= True
 
@@ -210,7 +210,7 @@ def processArguments(args: argparse.Namespace) -> int:
 def addSubparser(subparser: argparse._SubParsersAction[argparse.ArgumentParser]):
     parser = subparser.add_parser("singleFileDisasm", help=getToolDescription(), formatter_class=common.Utils.PreserveWhiteSpaceWrapRawTextHelpFormatter)
 
-    addOptionsToParser(parser)
+    common.Utils.addOptionsToParserLazily(parser, addOptionsToParser)
 
     parser.set_defaults(func=processArguments)
 